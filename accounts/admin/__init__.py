@@ -30,9 +30,11 @@ models_to_unfold = [
     ClockedSchedule,
 ]
 
+
+class GenericUnfoldAdmin(ModelAdmin):
+    pass
+
+
 for model in models_to_unfold:
     admin.site.unregister(model)
-
-    @admin.register(model)
-    class GenericUnfoldAdmin(ModelAdmin):
-        pass
+    admin.site.register(model, GenericUnfoldAdmin)
@@ -4,9 +4,25 @@ Path: accounts/admin/_user.py
 """
 from django.contrib import admin
 from unfold.admin import ModelAdmin  # Unfold's enhanced ModelAdmin
+from unfold.views import ChangeList
 from accounts.models import User
 
 
+class UserChangeList(ChangeList):
+    """
+    Changelist that loads only the columns ``list_display`` renders.
+
+    The M2M prefetch from ``UserAdmin.get_queryset`` serves the detail
+    form only, so it is dropped here.
+    """
+
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters)
+        field_names = {field.name for field in self.model._meta.concrete_fields}
+        columns = [name for name in self.list_display if name in field_names]
+        return queryset.prefetch_related(None).only(*columns)
+
+
 @admin.register(User)
 class UserAdmin(ModelAdmin):
     """
@@ -21,6 +37,10 @@ class UserAdmin(ModelAdmin):
                    "is_superuser", "date_joined")
     search_fields = ("username", "email")
     ordering = ("-date_joined",)
+    # Bounded pages and no unfiltered COUNT(*) on every changelist render.
+    list_per_page = 25
+    list_max_show_all = 100
+    show_full_result_count = False
     readonly_fields = ("date_joined", "last_login", "updated_at")
 
     # Fieldsets (grouping in detail view)
@@ -38,3 +58,20 @@ class UserAdmin(ModelAdmin):
         "default_columns": ["id", "username", "email", "is_verified", "date_joined"],
         "collapse_filters": True,
     }
+
+    def get_changelist(self, request, **kwargs):
+        return UserChangeList
+
+    def get_queryset(self, request):
+        """Prefetch the M2M relations rendered on the detail form."""
+        return super().get_queryset(request).prefetch_related(
+            "groups", "user_permissions"
+        )
+
+    def formfield_for_manytomany(self, db_field, request=None, **kwargs):
+        if db_field.name == "user_permissions":
+            qs = kwargs.get("queryset", db_field.remote_field.model.objects)
+            # Permission.__str__ reads content_type — load it in the same
+            # query instead of once per option in the select widget.
+            kwargs["queryset"] = qs.select_related("content_type")
+        return super().formfield_for_manytomany(db_field, request=request, **kwargs)
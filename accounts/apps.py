@@ -13,3 +13,4 @@ class AccountsConfig(AppConfig):
     def ready(self):
         # Register the drf-spectacular auth extension at app-ready time (after settings are fully configured).
         import config.spectacular_auth  # noqa: F401
+        import accounts.handlers.user_cache  # noqa: F401
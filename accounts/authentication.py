@@ -10,10 +10,15 @@ cross-site request forgery on cookie-transported mutations.
 
 from django.conf import settings
 from django.middleware.csrf import CsrfViewMiddleware
+from django.utils.translation import gettext_lazy as _
 from rest_framework import exceptions
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
 
 from accounts.services.session import is_token_revoked
+from accounts.services.user_cache import get_cached_user
 from config.logger import logger
 
 
@@ -79,6 +84,43 @@ class CookieJWTAuthentication(JWTAuthentication):
         user = self.get_user(validated_token)
         return (user, validated_token)
 
+    def get_user(self, validated_token):
+        """
+        Resolve the token's user through the short-lived user cache.
+
+        Same checks as ``JWTAuthentication.get_user``; only the row lookup
+        differs (see ``accounts.services.user_cache``). The cached user has
+        ``password`` deferred, so ``CHECK_REVOKE_TOKEN`` costs one query.
+        """
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            ) from e
+
+        user = get_cached_user(user_id)
+        if user is None:
+            raise exceptions.AuthenticationFailed(
+                _("User not found"), code="user_not_found"
+            )
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise exceptions.AuthenticationFailed(
+                _("User is inactive"), code="user_inactive"
+            )
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+            ) != get_md5_hash_password(user.password):
+                raise exceptions.AuthenticationFailed(
+                    _("The user's password has been changed."),
+                    code="password_changed",
+                )
+
+        return user
+
     @staticmethod
     def _reject_if_revoked(result):
         """Apply the same revocation check to the header-auth fallback path."""
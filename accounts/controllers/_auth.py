@@ -11,26 +11,39 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework_simplejwt.views import TokenRefreshView as BaseTokenRefreshView
 from rest_framework_simplejwt.views import TokenVerifyView as BaseTokenVerifyView
 from django.conf import settings as django_settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.contrib.auth.tokens import default_token_generator
 from django.db import transaction
 from django.shortcuts import render
 from django.views.decorators.csrf import csrf_exempt, ensure_csrf_cookie
 from django.utils.decorators import method_decorator
 from djoser import views as djoser_views
 from djoser.conf import settings
-from djoser.utils import ActionViewMixin
+from djoser.utils import ActionViewMixin, decode_uid
 from accounts.authentication import enforce_csrf
 from errors.catalog import E
 from errors.exceptions import AppAPIError
 from accounts.serializers.auth import (
     CustomTokenObtainPairSerializer,
     KidTokenRefreshSerializer,
+    UserSerializer,
+    serialize_users,
 )
-from accounts.services.session import detect_refresh_reuse, revoke_all_sessions
+from accounts.services.session import (
+    detect_refresh_reuse,
+    is_expired_jwt,
+    looks_like_jwt,
+    revoke_all_sessions,
+)
+from accounts.services.user_cache import ACTIVATED_CACHE_KEY, ACTIVATED_CACHE_TTL_SECONDS
+from accounts.tasks import blacklist_refresh_token
+from accounts.tokens import KidRefreshToken
 from accounts.schemas._user import (
     CurrentUserResponse,
     UserCreateRequest,
@@ -60,6 +73,7 @@ from drf_spectacular.utils import (
     OpenApiExample,
 )
 from utils.api_response import meta_for_request, ok
+from utils.celery_helpers import safe_task_delay
 
 User = get_user_model()
 
@@ -178,6 +192,41 @@ class CustomUserViewSet(djoser_views.UserViewSet):
     Handles user CRUD operations with JWT-specific logout logic.
     """
 
+    # HTTP method -> handler for the /me endpoint: the four methods the
+    # @action below lists, plus HEAD, which DRF routes wherever GET is.
+    _ME_ACTIONS = {
+        "GET": "retrieve",
+        "HEAD": "retrieve",
+        "PUT": "update",
+        "PATCH": "partial_update",
+        "DELETE": "destroy",
+    }
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == "list":
+            # Newest first; User.Meta declares no default ordering.
+            queryset = queryset.order_by("-date_joined")
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        """
+        List users via ``serialize_users`` (``.values()`` rows) instead of
+        instantiating every User for ``UserSerializer``. Falls back to the
+        stock path if pagination or a different list serializer is
+        configured.
+        """
+        if self.paginator is not None or self.get_serializer_class() is not UserSerializer:
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response(serialize_users(queryset))
+
+    def get_object(self):
+        """Resolve ``/me`` to the requesting user; every other action uses the URL pk."""
+        if self.action == "me":
+            return self.get_instance()
+        return super().get_object()
+
     def finalize_response(self, request, response, *args, **kwargs):
         """Wrap successful bodies in the standard envelope.
 
@@ -268,18 +317,11 @@ class CustomUserViewSet(djoser_views.UserViewSet):
         Custom /me endpoint with proper JWT handling.
         Overrides Djoser's me method to fix the Token model issue.
         """
-        self.get_object = self.get_instance
-        logger.debug(f"User profile access: user_id={request.user.id}, method={request.method}")
-        
-        if request.method == "GET":
-            return self.retrieve(request, *args, **kwargs)
-        elif request.method == "PUT":
-            return self.update(request, *args, **kwargs)
-        elif request.method == "PATCH":
-            return self.partial_update(request, *args, **kwargs)
-        elif request.method == "DELETE":
-            # Use our custom destroy method
-            return self.destroy(request, *args, **kwargs)
+        logger.bind(user_id=request.user.id, method=request.method).debug("auth.me_accessed")
+
+        # DELETE resolves to our custom destroy method.
+        handler = getattr(self, self._ME_ACTIONS[request.method])
+        return handler(request, *args, **kwargs)
 
     def set_password(self, request, *args, **kwargs):
         """Revoke every outstanding session after a successful password change."""
@@ -305,8 +347,6 @@ class CustomUserViewSet(djoser_views.UserViewSet):
         return response
 
 
-from rest_framework_simplejwt.views import TokenObtainPairView
-
 class CustomJWTTokenCreateView(TokenObtainPairView):
     """
     Custom JWT token creation view that uses our custom serializer.
@@ -369,22 +409,25 @@ class CustomJWTTokenRefreshView(BaseTokenRefreshView):
 
     def post(self, request, *args, **kwargs):
         cookie_name = _jwt_cfg()["AUTH_COOKIE_REFRESH"]
-        data = request.data.copy() if hasattr(request.data, "copy") else dict(request.data)
+        # The serializer only reads ``refresh``, so pass just that key
+        # rather than copying the whole parsed body (QueryDict.copy() is a
+        # deepcopy).
+        refresh_value = request.data.get("refresh")
 
         using_cookie = False
-        if not data.get("refresh"):
+        if not refresh_value:
             refresh_from_cookie = request.COOKIES.get(cookie_name)
             if refresh_from_cookie:
-                data["refresh"] = refresh_from_cookie
+                refresh_value = refresh_from_cookie
                 using_cookie = True
 
         if using_cookie:
             enforce_csrf(request)
 
-        refresh_value = data.get("refresh")
         if refresh_value:
             detect_refresh_reuse(refresh_value)
 
+        data = {} if refresh_value is None else {"refresh": refresh_value}
         serializer = self.get_serializer(data=data)
         serializer.is_valid(raise_exception=True)
 
@@ -450,28 +493,33 @@ class CustomJWTTokenVerifyView(BaseTokenVerifyView):
         return response
 
 
+# Schema fragments are built once at import and shared by reference.
+_LOGOUT_RESPONSES = {
+    204: None,
+    400: {
+        "description": "Bad request - refresh token required or invalid",
+        "type": "object",
+        "properties": {
+            "detail": {"type": "string", "example": "Refresh token is required."}
+        },
+    },
+}
+_LOGOUT_EXAMPLES = [
+    OpenApiExample(
+        "Logout Request",
+        value={"refresh": "your_refresh_token_here"},
+        request_only=True,
+    )
+]
+
+
 @extend_schema(
     tags=["Authentication"],
     summary="JWT Logout",
     description="Logout and blacklist the refresh token",
     request=JWTLogoutRequest,
-    responses={
-        204: None,
-        400: {
-            "description": "Bad request - refresh token required or invalid",
-            "type": "object",
-            "properties": {
-                "detail": {"type": "string", "example": "Refresh token is required."}
-            },
-        },
-    },
-    examples=[
-        OpenApiExample(
-            "Logout Request",
-            value={"refresh": "your_refresh_token_here"},
-            request_only=True,
-        )
-    ],
+    responses=_LOGOUT_RESPONSES,
+    examples=_LOGOUT_EXAMPLES,
 )
 class CustomJWTLogoutView(APIView):
     """
@@ -493,44 +541,76 @@ class CustomJWTLogoutView(APIView):
             bound_logger.warning("auth.jwt_logout_missing_refresh_token")
             raise AppAPIError(E.VALIDATION__MISSING_FIELD, status_code=400)
 
+        if not looks_like_jwt(refresh_token):
+            bound_logger.warning("auth.jwt_logout_malformed_refresh_token")
+            raise AppAPIError(E.AUTH__TOKEN_INVALID, status_code=400)
+
+        if is_expired_jwt(refresh_token):
+            # An expired refresh token can no longer be used, so there is
+            # nothing to blacklist: skip signature verification and the DB.
+            bound_logger.info("auth.jwt_logout_token_already_expired")
+            response = Response(status=status.HTTP_204_NO_CONTENT)
+            _clear_auth_cookies(response)
+            return response
+
         try:
-            token = RefreshToken(refresh_token)
-            token.blacklist()
-        except Exception as e:
+            # Validate synchronously so a bad token still gets a 400; the
+            # blacklist INSERT itself runs on a worker.
+            token = KidRefreshToken(refresh_token)
+        except TokenError as e:
             bound_logger.bind(error=type(e).__name__).error("auth.jwt_logout_error")
             raise AppAPIError(E.AUTH__TOKEN_INVALID, status_code=400)
 
+        # Visible to refresh/reuse checks right away, before the worker
+        # writes the BlacklistedToken row.
+        token.mark_blacklisted()
+        if safe_task_delay(blacklist_refresh_token, refresh_token) is None:
+            # Broker unavailable — never drop a revocation on the floor.
+            token.blacklist()
+
         bound_logger.info("auth.jwt_logout_success")
         response = Response(status=status.HTTP_204_NO_CONTENT)
         _clear_auth_cookies(response)
         return response
 
 
+# Columns the activation POST reads: is_active plus everything
+# PasswordResetTokenGenerator hashes (pk, password, last_login and the
+# model's configured email field). Nothing on this path touches groups or
+# permissions, so no prefetch is needed.
+_ACTIVATION_USER_FIELDS = (
+    "id", "is_active", "password", "last_login", User.get_email_field_name(),
+)
+
+_ACTIVATION_PARAMETERS = [
+    OpenApiParameter(
+        name="uid",
+        location=OpenApiParameter.PATH,
+        description="User ID for activation",
+        required=True,
+        type=str,
+    ),
+    OpenApiParameter(
+        name="token",
+        location=OpenApiParameter.PATH,
+        description="Activation token",
+        required=True,
+        type=str,
+    ),
+]
+_ACTIVATION_RESPONSES = {
+    200: ActivationResponse,
+    400: ActivationResponse,
+}
+
+
 @extend_schema(
     tags=["Authentication"],
     summary="User Activation",
     description="Activate user account with UID and token",
-    parameters=[
-        OpenApiParameter(
-            name="uid",
-            location=OpenApiParameter.PATH,
-            description="User ID for activation",
-            required=True,
-            type=str,
-        ),
-        OpenApiParameter(
-            name="token",
-            location=OpenApiParameter.PATH,
-            description="Activation token",
-            required=True,
-            type=str,
-        ),
-    ],
+    parameters=_ACTIVATION_PARAMETERS,
     request=None,
-    responses={
-        200: ActivationResponse,
-        400: ActivationResponse,
-    },
+    responses=_ACTIVATION_RESPONSES,
 )
 @method_decorator(csrf_exempt, name="dispatch")
 class CustomActivationView(ActionViewMixin, APIView):
@@ -543,11 +623,12 @@ class CustomActivationView(ActionViewMixin, APIView):
     @extend_schema(operation_id="auth_users_custom_activation_page")
     def get(self, request, uid, token):
         """Render the activation page."""
-        logger.info(f"User activation page accessed for uid={uid}")
+        logger.bind(uid=uid).info("auth.activation_page_accessed")
         context = {
             'uid': uid,
             'token': token,
-            'activation_url': f'/api/v1/auth/users/activation/{uid}/{token}/',
+            # The page POSTs back to the URL it was served from.
+            'activation_url': request.path,
             'app_name': settings.PROJECT_NAME
         }
         return render(request, 'accounts/activation.html', context)
@@ -555,46 +636,57 @@ class CustomActivationView(ActionViewMixin, APIView):
     @extend_schema(operation_id="auth_users_custom_activation")
     def post(self, request, uid, token):
         """Handle the actual activation."""
-        from djoser.utils import decode_uid
-        from django.contrib.auth.tokens import default_token_generator
-        from django.contrib.auth import get_user_model
-
-        User = get_user_model()
-        logger.info(f"User activation attempt for uid={uid}")
-
-        try:
-            # Reuses PrimaryReplicaRouter: activation reads must see rows on primary (replica can lag).
-            with read_from_primary():
-                try:
-                    decoded_uid = decode_uid(uid)
-                except Exception as e:
-                    logger.warning(f"UID decode failed for uid={uid}: {e}")
-                    raise AppAPIError(E.VALIDATION__INVALID_FORMAT, status_code=400)
-
-                try:
-                    user = User.objects.get(pk=decoded_uid)
-                except User.DoesNotExist:
-                    logger.warning(f"User not found for activation: decoded_uid={decoded_uid}")
-                    raise AppAPIError(E.RESOURCE__NOT_FOUND, status_code=400)
-
-                if user.is_active:
-                    logger.info(f"User already activated: user_id={user.id}")
-                    return ok({"detail": "Account is already activated."}, request)
-
-                if not default_token_generator.check_token(user, token):
-                    logger.warning(f"Invalid activation token for user_id={user.id}")
-                    raise AppAPIError(E.AUTH__TOKEN_INVALID, status_code=400)
-
-                user.is_active = True
-                user.save()
-                logger.info(f"User successfully activated: user_id={user.id}")
-                return ok(
-                    {"detail": "Account activated successfully. You can now log in."},
-                    request,
-                )
-
-        except AppAPIError:
-            raise
-        except Exception as e:
-            logger.error(f"User activation error for uid={uid}: {e}")
-            raise AppAPIError(E.INTERNAL__ERROR, status_code=500)
+        bound_logger = logger.bind(uid=uid)
+        bound_logger.info("auth.activation_attempt")
+
+        # Reuses PrimaryReplicaRouter: activation reads must see rows on primary (replica can lag).
+        # Anything not handled below is unexpected and surfaces as a 500 via
+        # custom_exception_handler.
+        with read_from_primary():
+            try:
+                decoded_uid = decode_uid(uid)
+            except ValueError as e:
+                # Bad base64 or non-UTF-8 payload (DjangoUnicodeDecodeError
+                # is a ValueError too).
+                bound_logger.bind(error=type(e).__name__).warning("auth.activation_uid_invalid")
+                raise AppAPIError(E.VALIDATION__INVALID_FORMAT, status_code=400)
+
+            try:
+                # Canonical pk value ("05" -> 5), so the marker key below
+                # matches the one invalidate_cached_user() clears.
+                user_pk = User._meta.pk.to_python(decoded_uid)
+            except DjangoValidationError as e:
+                # Decoded, but not a valid primary key value.
+                bound_logger.bind(error=type(e).__name__).warning("auth.activation_uid_invalid")
+                raise AppAPIError(E.VALIDATION__INVALID_FORMAT, status_code=400)
+
+            # Repeat clicks on an already-used link answer from the cache.
+            activated_key = ACTIVATED_CACHE_KEY.format(user_id=user_pk)
+            if cache.get(activated_key):
+                return ok({"detail": "Account is already activated."}, request)
+
+            try:
+                user = User.objects.only(*_ACTIVATION_USER_FIELDS).get(pk=user_pk)
+            except User.DoesNotExist:
+                bound_logger.warning("auth.activation_user_not_found")
+                raise AppAPIError(E.RESOURCE__NOT_FOUND, status_code=400)
+
+            if user.is_active:
+                bound_logger.bind(user_id=user.id).info("auth.activation_already_active")
+                cache.set(activated_key, 1, timeout=ACTIVATED_CACHE_TTL_SECONDS)
+                return ok({"detail": "Account is already activated."}, request)
+
+            if not default_token_generator.check_token(user, token):
+                bound_logger.bind(user_id=user.id).warning("auth.activation_token_invalid")
+                raise AppAPIError(E.AUTH__TOKEN_INVALID, status_code=400)
+
+            user.is_active = True
+            # ``updated_at`` is auto_now; list it so the narrowed UPDATE
+            # still stamps it.
+            user.save(update_fields=["is_active", "updated_at"])
+            cache.set(activated_key, 1, timeout=ACTIVATED_CACHE_TTL_SECONDS)
+            bound_logger.bind(user_id=user.id).info("auth.activation_success")
+            return ok(
+                {"detail": "Account activated successfully. You can now log in."},
+                request,
+            )
@@ -21,12 +21,15 @@ class CustomActivationEmail(email.ActivationEmail):
         if not user:
             return {}
         
-        # Generate the context data manually to avoid Djoser's problematic settings
+        # Generate the context data manually to avoid Djoser's problematic settings.
+        # make_token() is an HMAC over user state, so compute it (and the uid) once.
+        uid = utils.encode_uid(user.pk)
+        token = default_token_generator.make_token(user)
         context = {
             'user': user,
-            'uid': utils.encode_uid(user.pk),
-            'token': default_token_generator.make_token(user),
-            'url': f"/api/v1/auth/users/activation/{utils.encode_uid(user.pk)}/{default_token_generator.make_token(user)}/",
+            'uid': uid,
+            'token': token,
+            'url': f"/api/v1/auth/users/activation/{uid}/{token}/",
             'site_name': 'Your App Name',
             'support_email': 'support@yourapp.com',
         }
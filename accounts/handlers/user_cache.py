@@ -0,0 +1,16 @@
+"""
+Signal handlers keeping the authenticated-user cache coherent.
+Path: accounts/handlers/user_cache.py
+"""
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from accounts.services.user_cache import invalidate_cached_user
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def drop_cached_user(sender, instance, **kwargs):
+    """Invalidate the cached row whenever a user is saved or deleted."""
+    invalidate_cached_user(instance, using=kwargs.get("using"))
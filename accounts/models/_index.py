@@ -6,6 +6,8 @@ Path: accounts/models/_index.py
 from django.apps import apps
 from rest_framework.exceptions import ValidationError
 from django.db import models
+from django.db.models import Q
+from django.db.models.functions import Lower
 from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
 from django.contrib.auth.models import (
@@ -116,15 +118,24 @@ class User(AbstractBaseUser, PermissionsMixin):
         db_table = "users"  # Explicit table name
         verbose_name = _("User")
         verbose_name_plural = _("Users")
+        # Exact username/email lookups are served by the indexes their
+        # unique constraints already create. The Lower() indexes back the
+        # case-insensitive duplicate checks in UserCreateSerializer.
         indexes = [
-            # Speed up lookups by email
-            models.Index(fields=["email"]),
-            # Speed up lookups by username
-            models.Index(fields=["username"]),
-            # For queries filtering active/verified users
-            models.Index(fields=["is_active", "is_verified"]),
+            models.Index(Lower("username"), name="users_username_lower_idx"),
+            models.Index(Lower("email"), name="users_email_lower_idx"),
+            # For queries filtering active/verified users. Partial on
+            # is_active so inactive (unactivated) accounts stay out of it.
+            models.Index(
+                fields=["is_verified"],
+                condition=Q(is_active=True),
+                name="users_active_verified_idx",
+            ),
+            # Backs the newest-first listings (admin changelist, user list
+            # endpoint), which order explicitly — there is no default
+            # ordering, so plain lookups never pay for a sort.
+            models.Index(fields=["-date_joined"], name="users_date_joined_idx"),
         ]
-        ordering = ["-date_joined"]  # Newest users first
 
     def __str__(self):
         """String representation (shown in admin, shell, etc.)"""
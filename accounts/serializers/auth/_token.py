@@ -1,15 +1,17 @@
 """
 Custom JWT token serializers for authentication.
-Path: accounts/serializers/token.py
+Path: accounts/serializers/auth/_token.py
 """
 
 from rest_framework_simplejwt.serializers import (
     TokenObtainPairSerializer,
     TokenRefreshSerializer,
 )
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework import serializers
-from django.contrib.auth import authenticate
 from django.contrib.auth import get_user_model
+from django.contrib.auth.signals import user_login_failed
+from django.contrib.auth.models import update_last_login
 from django.contrib.auth.hashers import check_password
 from django.contrib.auth.models import Permission
 from django.db.models import Q
@@ -26,6 +28,12 @@ _DUMMY_PASSWORD_HASH = (
     "pbkdf2_sha256$720000$dummy$0000000000000000000000000000000000000000000="
 )
 
+# Columns read by validate() and get_token(); everything else stays deferred.
+_LOGIN_USER_FIELDS = (
+    "id", "username", "email", "password",
+    "is_active", "is_verified", "is_staff", "is_superuser",
+)
+
 imports = []
 
 
@@ -104,20 +112,24 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
             raise serializers.ValidationError(
                 'Must include username/email and password.')
 
-        # Look up by username and by email independently (rather than
-        # username-first-then-email) so a collision — one user's username
-        # equal to a different user's email — is detected instead of
-        # silently letting the username match win.
-        username_match = User.objects.filter(username=username_or_email).first()
-        email_match = User.objects.filter(email=username_or_email).first()
+        # One query matching on username OR email. Both sides are fetched
+        # (up to two rows) rather than username-first-then-email so a
+        # collision — one user's username equal to a different user's
+        # email — is detected instead of silently letting the username
+        # match win.
+        matches = list(
+            User.objects.filter(
+                Q(username=username_or_email) | Q(email=username_or_email)
+            ).only(*_LOGIN_USER_FIELDS)[:2]
+        )
 
-        if username_match and email_match and username_match.id != email_match.id:
+        if len(matches) > 1:
             check_password(password, _DUMMY_PASSWORD_HASH)
             logger.warning("auth.token_validate_identifier_collision")
             raise serializers.ValidationError(
                 'No user found with this username or email.')
 
-        user = username_match or email_match
+        user = matches[0] if matches else None
 
         if user is None:
             # Burn a real password hash computation so the not-found branch
@@ -135,33 +147,39 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
             logger.bind(user_id=user.id).warning("auth.token_validate_inactive_user")
             raise serializers.ValidationError('User account is disabled.')
 
-        # Authenticate with the found user's username (since that's what Django expects)
-        authenticated_user = authenticate(
-            request=self.context.get('request'),
-            username=user.username,  # Use the actual username for authentication
-            password=password
-        )
-
-        if authenticated_user is None:
+        # The user row is already loaded and is_active checked above, so the
+        # password is verified directly rather than via authenticate(),
+        # which would re-fetch the same row through ModelBackend. This
+        # relies on AUTHENTICATION_BACKENDS being the default ModelBackend;
+        # the failure signal authenticate() would send is fired here.
+        if not user.check_password(password):
+            user_login_failed.send(
+                sender=__name__,
+                credentials={'username': user.username, 'password': '********************'},
+                request=self.context.get('request'),
+            )
             logger.bind(user_id=user.id).warning("auth.token_validate_invalid_credentials")
             raise serializers.ValidationError('Invalid credentials.')
 
-        logger.bind(user_id=authenticated_user.id).info("auth.token_validate_success")
+        logger.bind(user_id=user.id).info("auth.token_validate_success")
+
+        if api_settings.UPDATE_LAST_LOGIN:
+            update_last_login(None, user)
 
         # Set the user for token generation
-        attrs['user'] = authenticated_user
+        attrs['user'] = user
 
         # Get the token pair
-        refresh = self.get_token(authenticated_user)
+        refresh = self.get_token(user)
 
         return {
             'refresh': str(refresh),
             'access': str(refresh.access_token),
             'user': {
-                'id': authenticated_user.id,
-                'username': authenticated_user.username,
-                'email': authenticated_user.email,
-                'is_verified': authenticated_user.is_verified,
+                'id': user.id,
+                'username': user.username,
+                'email': user.email,
+                'is_verified': user.is_verified,
             }
         }
 
@@ -1,8 +1,10 @@
 """
 Custom authentication serializers for Djoser integration.
-Path: accounts/serializers/auth.py
+Path: accounts/serializers/auth/_user.py
 """
 
+from functools import lru_cache
+
 from rest_framework import serializers
 from djoser.serializers import (
     UserCreateSerializer as DjoserUserCreateSerializer, 
@@ -10,6 +12,7 @@ from djoser.serializers import (
     UserDeleteSerializer as DjoserUserDeleteSerializer
 )
 from django.contrib.auth import get_user_model
+from django.db.models.functions import Lower
 from config.logger import logger
 
 User = get_user_model()
@@ -34,20 +37,34 @@ class UserCreateSerializer(DjoserUserCreateSerializer):
         }
 
     def validate_email(self, value):
-        """Custom email validation if needed."""
-        logger.debug(f"Email validation: {value}")
-        return value.lower()
+        """Lowercase the email and reject case-insensitive duplicates."""
+        return self._lower_unique('email', value)
 
     def validate_username(self, value):
-        """Custom username validation if needed."""
-        logger.debug(f"Username validation: {value}")
-        return value.lower()
+        """Lowercase the username and reject case-insensitive duplicates."""
+        return self._lower_unique('username', value)
+
+    def _lower_unique(self, field_name, value):
+        """
+        Return ``value`` lowercased, or raise if it matches an existing row
+        case-insensitively.
+
+        The field's UniqueValidator compares exactly, so ``Alice`` would pass
+        it next to a stored ``alice`` and only fail at INSERT. Filtering on
+        ``Lower(field)`` matches the ``users_*_lower_idx`` indexes.
+        """
+        value = value if value.islower() else value.lower()
+        if User.objects.alias(lowered=Lower(field_name)).filter(lowered=value).exists():
+            raise serializers.ValidationError(
+                User._meta.get_field(field_name).error_messages['unique']
+            )
+        return value
 
     def create(self, validated_data):
         """Create user with logging."""
-        logger.info(f"Creating new user with username: {validated_data.get('username')}, email: {validated_data.get('email')}")
+        logger.info("auth.user_create_started")
         user = super().create(validated_data)
-        logger.info(f"User created successfully: user_id={user.id}, username={user.username}")
+        logger.bind(user_id=user.id).info("auth.user_created")
         return user
 
 imports += ["UserDeleteSerializer"]
@@ -70,13 +87,14 @@ class UserDeleteSerializer(DjoserUserDeleteSerializer):
     def validate_current_password(self, value):
         """Validate current password with logging."""
         user = self.context['request'].user
-        logger.info(f"Password validation for user deletion: user_id={user.id}, username={user.username}")
-        
+        bound_logger = logger.bind(user_id=user.id)
+        bound_logger.info("auth.user_delete_password_check")
+
         if not user.check_password(value):
-            logger.warning(f"Invalid password for user deletion: user_id={user.id}, username={user.username}")
+            bound_logger.warning("auth.user_delete_invalid_password")
             raise serializers.ValidationError("Invalid password.")
-        
-        logger.debug(f"Password validation successful for user deletion: user_id={user.id}")
+
+        bound_logger.debug("auth.user_delete_password_ok")
         return value
 
 imports += ["UserSerializer"]
@@ -100,10 +118,34 @@ class UserSerializer(DjoserUserSerializer):
         )
         read_only_fields = ('id', 'date_joined', 'last_login', 'updated_at')
 
-    def to_representation(self, instance):
-        """Log user data access."""
-        logger.debug(f"User data accessed: user_id={instance.id}, username={instance.username}")
-        return super().to_representation(instance)
+imports += ["serialize_users"]
+
+
+@lru_cache(maxsize=None)
+def _user_datetime_fields():
+    """UserSerializer's own DateTimeField instances by name, built once."""
+    return {
+        name: field
+        for name, field in UserSerializer().fields.items()
+        if isinstance(field, serializers.DateTimeField)
+    }
+
+
+def serialize_users(queryset):
+    """
+    Fast path equivalent to ``UserSerializer(queryset, many=True).data``.
+
+    Every UserSerializer field is a plain column, so rows are read with
+    ``.values()`` — no model instances, no per-field serializer calls. Only
+    the datetime columns need formatting, done by the serializer's own
+    DateTimeFields so the two paths cannot drift.
+    """
+    datetime_fields = _user_datetime_fields()
+    rows = list(queryset.values(*UserSerializer.Meta.fields))
+    for row in rows:
+        for name, field in datetime_fields.items():
+            row[name] = field.to_representation(row[name])
+    return rows
 
 imports += ["CurrentUserSerializer"]
 class CurrentUserSerializer(DjoserUserSerializer):
@@ -127,24 +169,19 @@ class CurrentUserSerializer(DjoserUserSerializer):
         read_only_fields = ('id', 'is_active', 'date_joined',
                             'last_login', 'updated_at')
 
-    def to_representation(self, instance):
-        """Log current user profile access."""
-        logger.debug(f"Current user profile accessed: user_id={instance.id}, username={instance.username}")
-        return super().to_representation(instance)
-
     def update(self, instance, validated_data):
         """Custom update logic for current user with logging."""
-        logger.info(f"Current user profile update: user_id={instance.id}, username={instance.username}")
-        
+        bound_logger = logger.bind(user_id=instance.id)
+        bound_logger.info("auth.profile_update_started")
+
         # Handle email changes - you might want to re-verify email
-        if 'email' in validated_data and validated_data['email'] != instance.email:
-            old_email = instance.email
-            new_email = validated_data['email']
-            logger.info(f"Email change detected: user_id={instance.id}, old_email={old_email}, new_email={new_email}")
+        new_email = validated_data.get('email')
+        if new_email is not None and new_email != instance.email:
+            bound_logger.info("auth.profile_email_changed")
             instance.is_verified = False
 
         updated_user = super().update(instance, validated_data)
-        logger.info(f"Current user profile updated successfully: user_id={updated_user.id}, username={updated_user.username}")
+        bound_logger.info("auth.profile_updated")
         return updated_user
 
 
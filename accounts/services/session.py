@@ -2,8 +2,10 @@
 Session management service — JWT session revocation.
 Path: accounts/services/session.py
 """
+import time
+
+import jwt
 from django.core.cache import cache
-from django.db import transaction
 from django.utils import timezone
 from rest_framework_simplejwt.exceptions import TokenBackendError
 from rest_framework_simplejwt.settings import api_settings as simplejwt_settings
@@ -23,6 +25,91 @@ from config.logger import logger
 # (`time.time()`); always normalize with `int(...)`.
 REVOKED_AFTER_TTL_SECONDS = 60 * 60 * 24 * 7  # 7 days — matches refresh-token lifetime
 
+# Blacklisted refresh-token jtis are mirrored into the cache (Redis in
+# production) so repeat blacklist checks — replayed or rotated tokens —
+# answer from a single key lookup. BlacklistedToken rows stay the source of
+# truth: a cache miss always falls through to the DB, and each entry
+# expires together with the token it describes.
+BLACKLISTED_JTI_KEY = "auth:blacklisted_jti:{jti}"
+
+
+def mark_jtis_blacklisted(tokens) -> None:
+    """
+    Mirror blacklisted refresh tokens into the cache.
+
+    ``tokens`` is an iterable of ``(jti, expires_at)`` pairs; tokens that
+    have already expired are skipped (they can no longer be presented).
+    """
+    now = timezone.now()
+    by_timeout = {}
+    for jti, expires_at in tokens:
+        ttl = int((expires_at - now).total_seconds())
+        if ttl > 0:
+            by_timeout.setdefault(ttl, {})[BLACKLISTED_JTI_KEY.format(jti=jti)] = 1
+    for ttl, entries in by_timeout.items():
+        cache.set_many(entries, timeout=ttl)
+
+
+def is_jti_blacklisted(jti) -> bool:
+    """
+    True if the refresh token ``jti`` is blacklisted.
+
+    Checks the cache first; on a miss, queries BlacklistedToken and
+    backfills the cache on a hit so the next check skips the DB.
+    """
+    if cache.get(BLACKLISTED_JTI_KEY.format(jti=jti)):
+        return True
+
+    expires_at = (
+        BlacklistedToken.objects.filter(token__jti=jti)
+        .values_list("token__expires_at", flat=True)
+        .first()
+    )
+    if expires_at is None:
+        return False
+
+    mark_jtis_blacklisted([(jti, expires_at)])
+    return True
+
+
+# Generous upper bound for an encoded refresh token; an RS256 token with
+# this project's claims is well under 1 KB.
+MAX_JWT_LENGTH = 4096
+
+
+def looks_like_jwt(raw_token) -> bool:
+    """
+    Cheap structural check run before any JWT decode.
+
+    Rejects values that cannot possibly be a compact JWS (wrong number of
+    segments, empty segments, non-ASCII, oversized) so bot garbage never
+    reaches signature verification. Passing this check proves nothing
+    about validity.
+    """
+    if not isinstance(raw_token, str) or len(raw_token) > MAX_JWT_LENGTH:
+        return False
+    if not raw_token.isascii() or raw_token.count(".") != 2:
+        return False
+    return all(raw_token.split("."))
+
+
+def is_expired_jwt(raw_token) -> bool:
+    """
+    True if ``raw_token``'s ``exp`` claim is already in the past.
+
+    Reads the payload WITHOUT verifying the signature. That is only safe
+    for short-circuits where an expired token needs no further work (an
+    expired refresh token can never be used again, so logging it out is
+    a no-op); never use it to trust a token. Unreadable payloads return
+    False so the caller falls through to full verification.
+    """
+    try:
+        payload = jwt.decode(raw_token, options={"verify_signature": False})
+    except jwt.PyJWTError:
+        return False
+    exp = payload.get("exp")
+    return isinstance(exp, (int, float)) and exp <= time.time()
+
 
 def revoke_all_sessions(user_id, event: str) -> int:
     """
@@ -36,24 +123,24 @@ def revoke_all_sessions(user_id, event: str) -> int:
     Returns the count of newly blacklisted tokens.
     """
     now = timezone.now()
-    outstanding_tokens = list(
-        OutstandingToken.objects.filter(user_id=user_id, expires_at__gt=now)
+    # One SELECT for the live, not-yet-blacklisted tokens, one INSERT for
+    # all of them.
+    to_blacklist = list(
+        OutstandingToken.objects.filter(
+            user_id=user_id,
+            expires_at__gt=now,
+            blacklistedtoken__isnull=True,
+        ).only("id", "jti", "expires_at")
     )
-    already_blacklisted_ids = set(
-        BlacklistedToken.objects.filter(
-            token__in=outstanding_tokens
-        ).values_list("token_id", flat=True)
-    )
-    to_create = [
-        BlacklistedToken(token=token)
-        for token in outstanding_tokens
-        if token.id not in already_blacklisted_ids
-    ]
-
-    with transaction.atomic():
-        if to_create:
-            BlacklistedToken.objects.bulk_create(to_create, ignore_conflicts=True)
+    to_create = [BlacklistedToken(token=token) for token in to_blacklist]
+
+    # bulk_create is already atomic on its own (savepoint=False), and
+    # callers such as account deletion wrap this in their own transaction
+    # — an extra atomic block here would only add a SAVEPOINT round-trip.
+    if to_create:
+        BlacklistedToken.objects.bulk_create(to_create, ignore_conflicts=True)
     count = len(to_create)
+    mark_jtis_blacklisted((token.jti, token.expires_at) for token in to_blacklist)
 
     cache.set(
         f"auth:revoked_after:{user_id}",
@@ -90,7 +177,7 @@ def detect_refresh_reuse(raw_token: str) -> None:
     backend directly performs signature + expiry verification only, without
     the blacklist short-circuit.
     """
-    if not raw_token:
+    if not looks_like_jwt(raw_token):
         return
 
     try:
@@ -107,7 +194,7 @@ def detect_refresh_reuse(raw_token: str) -> None:
     if not jti or not user_id:
         return
 
-    if BlacklistedToken.objects.filter(token__jti=jti).exists():
+    if is_jti_blacklisted(jti):
         logger.bind(user_id=user_id).warning("refresh.reuse_detected")
         revoke_all_sessions(user_id, event="refresh_reuse")
 
@@ -0,0 +1,80 @@
+"""
+Short-lived cache of authenticated users.
+Path: accounts/services/user_cache.py
+
+Every JWT-authenticated request resolves the token's user id to a User row.
+Caching that row for a short TTL answers repeat requests from the same user
+with one cache lookup instead of a SELECT. Entries are dropped on every
+User save/delete (see ``accounts.handlers.user_cache``) and again once the
+surrounding transaction commits; the TTL bounds staleness for writes that
+bypass model signals (``QuerySet.update``).
+
+Only the row's column values are cached, never the password hash: the
+returned User has ``password`` deferred and loads it on first access.
+"""
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework_simplejwt.settings import api_settings
+
+User = get_user_model()
+
+AUTH_USER_KEY = "auth:user:{user_id}"
+AUTH_USER_TTL_SECONDS = 60
+
+# Set by the activation view once a user is known to be active, so repeat
+# POSTs of the activation link skip the user SELECT and token hash. Dropped
+# together with AUTH_USER_KEY on every save/delete, so a deleted or
+# deactivated user goes back through the database path.
+ACTIVATED_CACHE_KEY = "auth:activated:{user_id}"
+ACTIVATED_CACHE_TTL_SECONDS = 60 * 60
+
+# Every concrete column except the password hash, in model order (the order
+# Model.from_db expects). Covers the auth checks, permissions and /me.
+_CACHED_USER_FIELDS = tuple(
+    field.attname
+    for field in User._meta.concrete_fields
+    if field.attname != "password"
+)
+
+
+def get_cached_user(user_id):
+    """
+    Return the User whose ``SIMPLE_JWT['USER_ID_FIELD']`` equals ``user_id``,
+    or None if it does not exist.
+
+    Served from the cache when possible; a miss loads the row and caches it.
+    Missing users are not cached, so a just-created account is visible
+    immediately.
+    """
+    key = AUTH_USER_KEY.format(user_id=user_id)
+    row = cache.get(key)
+    if row is None:
+        row = (
+            User.objects.filter(**{api_settings.USER_ID_FIELD: user_id})
+            .values(*_CACHED_USER_FIELDS)
+            .first()
+        )
+        if row is None:
+            return None
+        cache.set(key, row, timeout=AUTH_USER_TTL_SECONDS)
+    return User.from_db(
+        User.objects.db, _CACHED_USER_FIELDS, [row[name] for name in _CACHED_USER_FIELDS]
+    )
+
+
+def invalidate_cached_user(user, using=None) -> None:
+    """
+    Drop the cached row and activation marker for ``user`` so the next
+    lookup hits the DB.
+
+    The keys are cleared now and again when the transaction on ``using``
+    commits: a concurrent request can re-cache the pre-commit row in
+    between, e.g. while an admin deactivates a user inside ``atomic()``.
+    """
+    keys = [
+        AUTH_USER_KEY.format(user_id=getattr(user, api_settings.USER_ID_FIELD)),
+        ACTIVATED_CACHE_KEY.format(user_id=user.pk),
+    ]
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys), using=using)
@@ -4,9 +4,10 @@ Path: accounts/tasks/__init__.py
 """
 
 from ._example import example_cleanup_task
-from .token_tasks import flush_expired_jwt_tokens
+from .token_tasks import blacklist_refresh_token, flush_expired_jwt_tokens
 
 __all__ = [
+    "blacklist_refresh_token",
     "example_cleanup_task",
     "flush_expired_jwt_tokens",
 ]
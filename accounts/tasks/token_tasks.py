@@ -39,3 +39,42 @@ def flush_expired_jwt_tokens():
         blacklist_deleted=blacklist_deleted,
     ).info("jwt.flush_expired_tokens")
     return outstanding_deleted
+
+
+@shared_task(
+    name="accounts.tasks.blacklist_refresh_token",
+    autoretry_for=(Exception,),
+    max_retries=3,
+    retry_backoff=True,
+    retry_backoff_max=300,
+    retry_jitter=True,
+    time_limit=30,
+    soft_time_limit=25,
+    ignore_result=True,
+)
+def blacklist_refresh_token(raw_token):
+    """
+    Blacklist a refresh token off the request thread (logout).
+
+    The logout view has already mirrored the jti into the blacklist cache,
+    so the token is verified here for signature and expiry only — a full
+    ``KidRefreshToken(raw_token)`` would consult that cache and reject it
+    before the DB row is written.
+
+    Idempotent: a token that expired between enqueue and execution, or
+    whose BlacklistedToken row already exists, is a no-op (returns False).
+    """
+    from rest_framework_simplejwt.exceptions import TokenBackendError
+    from rest_framework_simplejwt.state import token_backend
+    from accounts.tokens import KidRefreshToken
+
+    try:
+        token_backend.decode(raw_token, verify=True)
+    except TokenBackendError:
+        logger.info("jwt.blacklist_refresh_token_skipped")
+        return False
+
+    _, created = KidRefreshToken(raw_token, verify=False).blacklist()
+    if not created:
+        logger.info("jwt.blacklist_refresh_token_skipped")
+    return created
@@ -12,58 +12,55 @@ from accounts.admin import UserAdmin
 from accounts.models import User
 from accounts.tests.factories import UserFactory
 
+# Read-only configuration tests share one admin instance.
+_USER_ADMIN = UserAdmin(User, AdminSite())
+
 
 class TestUserAdmin:
     """Test UserAdmin configuration."""
     
-    @pytest.mark.django_db
     def test_user_admin_list_display(self):
         """Test that UserAdmin has correct list_display."""
-        admin = UserAdmin(UserFactory(), AdminSite())
+        admin = _USER_ADMIN
         
         expected_fields = ['id', 'username', 'email', 'is_active', 'is_verified', 'is_staff', 'date_joined']
         for field in expected_fields:
             assert field in admin.list_display
     
-    @pytest.mark.django_db
     def test_user_admin_list_filter(self):
         """Test that UserAdmin has correct list_filter."""
-        admin = UserAdmin(UserFactory(), AdminSite())
+        admin = _USER_ADMIN
         
         expected_filters = ['is_active', 'is_verified', 'is_staff', 'is_superuser', 'date_joined']
         for filter_field in expected_filters:
             assert filter_field in admin.list_filter
     
-    @pytest.mark.django_db
     def test_user_admin_search_fields(self):
         """Test that UserAdmin has correct search_fields."""
-        admin = UserAdmin(UserFactory(), AdminSite())
+        admin = _USER_ADMIN
         
         expected_search_fields = ['username', 'email']
         for search_field in expected_search_fields:
             assert search_field in admin.search_fields
     
-    @pytest.mark.django_db
     def test_user_admin_ordering(self):
         """Test that UserAdmin has correct ordering."""
-        admin = UserAdmin(UserFactory(), AdminSite())
+        admin = _USER_ADMIN
         
         # ordering is a tuple, not a list
         assert admin.ordering == ('-date_joined',)
     
-    @pytest.mark.django_db
     def test_user_admin_readonly_fields(self):
         """Test that UserAdmin has correct readonly_fields."""
-        admin = UserAdmin(UserFactory(), AdminSite())
+        admin = _USER_ADMIN
         
         expected_readonly = ['date_joined', 'last_login', 'updated_at']
         for readonly_field in expected_readonly:
             assert readonly_field in admin.readonly_fields
     
-    @pytest.mark.django_db
     def test_user_admin_fieldsets(self):
         """Test that UserAdmin has correct fieldsets."""
-        admin = UserAdmin(UserFactory(), AdminSite())
+        admin = _USER_ADMIN
         
         # Check that fieldsets are defined
         assert hasattr(admin, 'fieldsets')
@@ -76,10 +73,9 @@ class TestUserAdmin:
         for section in expected_sections:
             assert section in fieldset_titles
     
-    @pytest.mark.django_db
     def test_user_admin_unfold_configuration(self):
         """Test that UserAdmin has Unfold-specific configuration."""
-        admin = UserAdmin(UserFactory(), AdminSite())
+        admin = _USER_ADMIN
         
         # Check for Unfold-specific attributes
         assert hasattr(admin, 'unfold_list_display')
@@ -163,3 +159,60 @@ class TestUserAdminIntegration(TestCase):
         """Test that user string representation works in admin."""
         # The string representation should be the username
         assert str(self.regular_user) == self.regular_user.username
+
+    @pytest.mark.django_db
+    def test_user_admin_queryset_prefetches_m2m(self):
+        """Detail-form M2M relations are prefetched instead of queried per field."""
+        queryset = self.user_admin.get_queryset(None)
+
+        assert set(queryset._prefetch_related_lookups) == {'groups', 'user_permissions'}
+
+    @pytest.mark.django_db
+    def test_user_permissions_formfield_selects_content_type(self):
+        """Permission choices load their content type in the same query."""
+        from django.test import RequestFactory
+
+        request = RequestFactory().get('/admin/accounts/user/')
+        request.user = self.staff_user
+        db_field = User._meta.get_field('user_permissions')
+        formfield = self.user_admin.formfield_for_manytomany(db_field, request=request)
+
+        assert formfield.queryset.query.select_related == {'content_type': {}}
+
+
+class TestCeleryBeatAdminRegistration:
+    """Celery beat models are registered with the shared Unfold admin."""
+
+    def test_celery_beat_models_share_one_admin_class(self):
+        from accounts.admin import GenericUnfoldAdmin, models_to_unfold
+
+        for model in models_to_unfold:
+            assert type(admin.site._registry[model]) is GenericUnfoldAdmin
+
+
+@pytest.mark.django_db
+class TestUserAdminChangelist:
+    """The changelist renders bounded pages from a narrowed SELECT."""
+
+    def test_changelist_paging_configuration(self):
+        user_admin = _USER_ADMIN
+
+        assert user_admin.list_per_page == 25
+        assert user_admin.list_max_show_all == 100
+        assert user_admin.show_full_result_count is False
+
+    def test_changelist_queryset_loads_only_list_display_columns(self, client, superuser):
+        superuser.refresh_from_db()  # session hash must match the stored password
+        client.force_login(superuser)
+        UserFactory.create_batch(3)
+
+        response = client.get('/admin/accounts/user/')
+
+        assert response.status_code == 200
+        queryset = response.context['cl'].queryset
+        deferred, is_deferred = queryset.query.deferred_loading
+        assert is_deferred is False
+        assert set(deferred) == {
+            'id', 'username', 'email', 'is_active', 'is_verified', 'is_staff', 'date_joined'
+        }
+        assert queryset._prefetch_related_lookups == ()
@@ -64,6 +64,25 @@ def authenticated_client(api_client, user):
     return api_client
 
 
+@pytest.fixture
+def force_auth_client(api_client, user):
+    """Return an API client force-authenticated as ``user``, skipping JWT
+    issue and verification."""
+    api_client.force_authenticate(user=user)
+    return api_client
+
+
+@pytest.fixture
+def dbless_authenticated_client(api_client):
+    """Return an API client force-authenticated as an unsaved user.
+
+    For tests whose view path never reaches the ORM; they can then run
+    without the django_db mark.
+    """
+    api_client.force_authenticate(user=UserFactory.build(pk=1))
+    return api_client
+
+
 @pytest.fixture
 def staff_client(api_client, staff_user):
     """Return an authenticated API client with staff user."""
@@ -5,6 +5,8 @@ Path: accounts/tests/controllers/test_cookie_auth.py
 """
 
 import time
+from datetime import timedelta
+from unittest.mock import patch
 
 import pytest
 from django.conf import settings as django_settings
@@ -192,6 +194,52 @@ class TestLogout:
         outstanding = OutstandingToken.objects.get(jti=refresh["jti"])
         assert BlacklistedToken.objects.filter(token=outstanding).exists()
 
+    def test_logout_blacklists_inline_when_task_cannot_be_queued(self, user):
+        client = _client(enforce_csrf=True)
+        access = str(RefreshToken.for_user(user).access_token)
+        refresh = RefreshToken.for_user(user)
+        client.cookies[ACCESS_COOKIE] = access
+        cookie_value, header_token = _csrf_pair()
+        client.cookies["csrftoken"] = cookie_value
+
+        with patch("accounts.controllers._auth.safe_task_delay", return_value=None):
+            response = client.post(
+                reverse("jwt-destroy"),
+                {"refresh": str(refresh)},
+                HTTP_X_CSRFTOKEN=header_token,
+            )
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        outstanding = OutstandingToken.objects.get(jti=refresh["jti"])
+        assert BlacklistedToken.objects.filter(token=outstanding).exists()
+
+    def test_logout_revokes_token_before_the_task_runs(self, user):
+        client = _client()
+        refresh = RefreshToken.for_user(user)
+        client.cookies[ACCESS_COOKIE] = str(refresh.access_token)
+
+        with patch("accounts.controllers._auth.safe_task_delay", return_value=object()):
+            response = client.post(reverse("jwt-destroy"), {"refresh": str(refresh)})
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert not BlacklistedToken.objects.exists()
+        refresh_response = client.post(reverse("jwt-refresh"), {"refresh": str(refresh)})
+        assert refresh_response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_logout_with_expired_refresh_token_skips_blacklist(self, user):
+        client = _client()
+        refresh = RefreshToken.for_user(user)
+        refresh.set_exp(lifetime=-timedelta(seconds=1))
+        client.cookies[ACCESS_COOKIE] = str(RefreshToken.for_user(user).access_token)
+
+        with patch("accounts.controllers._auth.KidRefreshToken") as mock_token:
+            response = client.post(reverse("jwt-destroy"), {"refresh": str(refresh)})
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        mock_token.assert_not_called()
+        assert not BlacklistedToken.objects.exists()
+        assert response.cookies.get(REFRESH_COOKIE).value == ""
+
     def test_logout_clears_auth_cookies(self, user):
         client = _client(enforce_csrf=True)
         access = str(RefreshToken.for_user(user).access_token)
@@ -7,6 +7,8 @@ import pytest
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from django.db import IntegrityError
+from django.db.models import Q
+from django.db.models.functions import Lower
 from django.utils import timezone
 from accounts.tests.factories import (
     UserFactory, 
@@ -32,10 +34,9 @@ class TestUserModel:
         assert user.is_staff is False
         assert user.is_superuser is False
     
-    @pytest.mark.django_db
     def test_user_string_representation(self):
         """Test user string representation."""
-        user = UserFactory()
+        user = UserFactory.build()
         
         # The string representation should be the username
         assert str(user) == user.username
@@ -103,34 +104,36 @@ class TestUserModel:
         # Only the domain part should be normalized to lowercase
         assert user.email == 'TEST@example.com'
     
-    @pytest.mark.django_db
-    def test_user_ordering(self):
-        """Test that users are ordered by date_joined descending."""
-        user1 = UserFactory()
-        user2 = UserFactory()
-        
-        # Get users in default ordering
-        users = User.objects.all()
-        
-        # Should be ordered by date_joined descending (newest first)
-        assert users[0].date_joined >= users[1].date_joined
+    def test_user_has_no_default_ordering(self):
+        """Test that plain user queries carry no implicit ORDER BY."""
+        assert User._meta.ordering == []
+        assert User.objects.all().ordered is False
+    
+    def test_user_indexes(self):
+        """Test the declared lowercase, partial active/verified and date_joined indexes."""
+        username_lower, email_lower, active_verified, date_joined = User._meta.indexes
+
+        assert username_lower.expressions == (Lower('username'),)
+        assert email_lower.expressions == (Lower('email'),)
+        assert active_verified.name == 'users_active_verified_idx'
+        assert active_verified.fields == ['is_verified']
+        assert active_verified.condition == Q(is_active=True)
+        assert date_joined.fields == ['-date_joined']
 
 
 class TestUserStatus:
     """Test user status-related functionality."""
     
-    @pytest.mark.django_db
     def test_inactive_user(self):
         """Test inactive user creation and properties."""
-        user = InactiveUserFactory()
+        user = InactiveUserFactory.build()
         
         assert user.is_active is False
         assert user.is_verified is True  # Can be verified but inactive
     
-    @pytest.mark.django_db
     def test_unverified_user(self):
         """Test unverified user creation and properties."""
-        user = UnverifiedUserFactory()
+        user = UnverifiedUserFactory.build()
         
         assert user.is_active is True
         assert user.is_verified is False
@@ -201,7 +204,6 @@ class TestUserTimestamps:
 class TestUserManagerErrors:
     """Test user manager error cases."""
     
-    @pytest.mark.django_db
     def test_create_user_without_email(self):
         """Test that creating a user without email raises an error."""
         with pytest.raises(ValueError, match="You must provide an email address"):
@@ -211,7 +213,6 @@ class TestUserManagerErrors:
                 password='testpass123'
             )
     
-    @pytest.mark.django_db
     def test_create_user_without_username(self):
         """Test that creating a user without username raises an error."""
         with pytest.raises(ValueError, match="You must provide a username"):
@@ -221,7 +222,6 @@ class TestUserManagerErrors:
                 password='testpass123'
             )
     
-    @pytest.mark.django_db
     def test_create_superuser_invalid_staff_flag(self):
         """Test that creating superuser with invalid staff flag raises error."""
         with pytest.raises(ValueError, match="Superuser must be assigned to is_staff=True"):
@@ -232,7 +232,6 @@ class TestUserManagerErrors:
                 is_staff=False
             )
     
-    @pytest.mark.django_db
     def test_create_superuser_invalid_superuser_flag(self):
         """Test that creating superuser with invalid superuser flag raises error."""
         with pytest.raises(ValueError, match="Superuser must be assigned to is_superuser=True"):
@@ -4,6 +4,7 @@ Path: accounts/tests/serializers/test_auth.py
 """
 
 import pytest
+from django.contrib.auth.signals import user_login_failed
 from django.test import TestCase
 from rest_framework.test import APIRequestFactory
 from rest_framework import serializers
@@ -14,6 +15,7 @@ from accounts.serializers.auth import (
     UserSerializer,
     CurrentUserSerializer
 )
+from accounts.models import User
 from accounts.tests.factories import UserFactory
 
 
@@ -270,6 +272,34 @@ class TestUserCreateSerializer:
         assert not serializer.is_valid()
         assert 'email' in serializer.errors
 
+    @pytest.mark.django_db
+    def test_duplicate_username_differing_in_case(self):
+        """A username matching an existing one case-insensitively is rejected."""
+        UserFactory(username='alice')
+
+        serializer = UserCreateSerializer(data={
+            'username': 'ALICE',
+            'email': 'other@example.com',
+            'password': 'newpass123'
+        })
+
+        assert not serializer.is_valid()
+        assert serializer.errors['username'] == ['A user with that username already exists.']
+
+    @pytest.mark.django_db
+    def test_duplicate_email_differing_in_case(self):
+        """An email matching an existing one case-insensitively is rejected."""
+        UserFactory(email='Alice@Example.com')
+
+        serializer = UserCreateSerializer(data={
+            'username': 'otheruser',
+            'email': 'alice@example.com',
+            'password': 'newpass123'
+        })
+
+        assert not serializer.is_valid()
+        assert serializer.errors['email'] == ['A user with that email already exists.']
+
 
 class TestUserDeleteSerializer:
     """Test UserDeleteSerializer functionality."""
@@ -354,6 +384,31 @@ class TestUserSerializer:
         assert updated_user.username == unique_username
 
 
+class TestSerializeUsers:
+    """serialize_users() matches UserSerializer output without instantiating users."""
+
+    @pytest.mark.django_db
+    def test_matches_user_serializer_output(self):
+        from django.utils import timezone
+
+        from accounts.serializers.auth import serialize_users
+
+        UserFactory(last_login=timezone.now())
+        UserFactory()
+        queryset = User.objects.order_by('id')
+
+        assert serialize_users(queryset) == [dict(row) for row in UserSerializer(queryset, many=True).data]
+
+    @pytest.mark.django_db
+    def test_runs_a_single_query(self, django_assert_num_queries):
+        from accounts.serializers.auth import serialize_users
+
+        UserFactory.create_batch(3)
+
+        with django_assert_num_queries(1):
+            assert len(serialize_users(User.objects.all())) == 3
+
+
 class TestCurrentUserSerializer:
     """Test CurrentUserSerializer functionality."""
     
@@ -740,68 +795,58 @@ class TestTokenSerializerMissingLines:
         assert token['is_staff'] == user.is_staff
     
     @pytest.mark.django_db
-    def test_validate_successful_authentication_with_mock(self):
-        """Test successful authentication with mocked authenticate function."""
-        from unittest.mock import patch
-        
+    def test_validate_successful_authentication(self):
+        """Test successful authentication against the stored password."""
         factory = APIRequestFactory()
         request = factory.post('/')
         
-        # Create a user
+        # Create a user with a persisted password
         user = UserFactory(username='testuser', email='test@example.com')
+        user.set_password('testpass123')
+        user.save(update_fields=['password'])
         
-        # Mock the authenticate function to return the user
-        with patch('accounts.serializers.auth._token.authenticate') as mock_authenticate:
-            mock_authenticate.return_value = user
-            
-            serializer = CustomTokenObtainPairSerializer(
-                data={'username': 'testuser', 'password': 'testpass123'},
-                context={'request': request}
-            )
-            
-            # This should succeed and return the complete token structure (covers lines 100-108)
-            result = serializer.validate({'username': 'testuser', 'password': 'testpass123'})
-            
-            # Verify the complete token structure is returned
-            assert 'refresh' in result
-            assert 'access' in result
-            assert 'user' in result
-            assert result['user']['id'] == user.id
-            assert result['user']['username'] == user.username
-            assert result['user']['email'] == user.email
-            assert result['user']['is_verified'] == user.is_verified
+        serializer = CustomTokenObtainPairSerializer(
+            data={'username': 'testuser', 'password': 'testpass123'},
+            context={'request': request}
+        )
+        
+        result = serializer.validate({'username': 'testuser', 'password': 'testpass123'})
+        
+        # Verify the complete token structure is returned
+        assert 'refresh' in result
+        assert 'access' in result
+        assert 'user' in result
+        assert result['user']['id'] == user.id
+        assert result['user']['username'] == user.username
+        assert result['user']['email'] == user.email
+        assert result['user']['is_verified'] == user.is_verified
     
     @pytest.mark.django_db
-    def test_validate_successful_email_authentication_with_mock(self):
-        """Test successful email authentication with mocked authenticate function."""
-        from unittest.mock import patch
-        
+    def test_validate_successful_email_authentication(self):
+        """Test successful email authentication against the stored password."""
         factory = APIRequestFactory()
         request = factory.post('/')
         
-        # Create a user
+        # Create a user with a persisted password
         user = UserFactory(username='testuser', email='test@example.com')
+        user.set_password('testpass123')
+        user.save(update_fields=['password'])
         
-        # Mock the authenticate function to return the user
-        with patch('accounts.serializers.auth._token.authenticate') as mock_authenticate:
-            mock_authenticate.return_value = user
-            
-            serializer = CustomTokenObtainPairSerializer(
-                data={'username': 'test@example.com', 'password': 'testpass123'},
-                context={'request': request}
-            )
-            
-            # This should succeed and return the complete token structure (covers lines 100-108)
-            result = serializer.validate({'username': 'test@example.com', 'password': 'testpass123'})
-            
-            # Verify the complete token structure is returned
-            assert 'refresh' in result
-            assert 'access' in result
-            assert 'user' in result
-            assert result['user']['id'] == user.id
-            assert result['user']['username'] == user.username
-            assert result['user']['email'] == user.email
-            assert result['user']['is_verified'] == user.is_verified
+        serializer = CustomTokenObtainPairSerializer(
+            data={'username': 'test@example.com', 'password': 'testpass123'},
+            context={'request': request}
+        )
+        
+        result = serializer.validate({'username': 'test@example.com', 'password': 'testpass123'})
+        
+        # Verify the complete token structure is returned
+        assert 'refresh' in result
+        assert 'access' in result
+        assert 'user' in result
+        assert result['user']['id'] == user.id
+        assert result['user']['username'] == user.username
+        assert result['user']['email'] == user.email
+        assert result['user']['is_verified'] == user.is_verified
     
     @pytest.mark.django_db
     def test_validate_missing_credentials_warning(self):
@@ -873,7 +918,50 @@ class TestTokenSerializerIdentifierCollision:
         )
 
         # No collision (both lookups resolve to the same user) — falls
-        # through to the normal authenticate() call, which fails in this
-        # test environment the same way the other success-path tests do.
+        # through to the password check, which fails because UserFactory
+        # does not persist the password.
         with pytest.raises(serializers.ValidationError, match="Invalid credentials"):
             serializer.validate({'username': 'sameuser', 'password': 'testpass123'})
+
+
+class TestTokenSerializerUserLookup:
+    """The username-or-email lookup resolves in a single query."""
+
+    @pytest.mark.django_db
+    def test_lookup_by_email_is_one_query(self, django_assert_num_queries):
+        UserFactory(email='lookup@example.com')
+        serializer = CustomTokenObtainPairSerializer(context={'request': None})
+
+        with django_assert_num_queries(1):
+            with pytest.raises(serializers.ValidationError, match="Invalid credentials"):
+                serializer.validate({'username': 'lookup@example.com', 'password': 'wrong-password'})
+
+    @pytest.mark.django_db
+    def test_successful_login_updates_last_login(self):
+        user = UserFactory()
+        user.set_password('testpass123')
+        user.save(update_fields=['password'])
+        serializer = CustomTokenObtainPairSerializer(context={'request': None})
+
+        serializer.validate({'username': user.username, 'password': 'testpass123'})
+
+        user.refresh_from_db()
+        assert user.last_login is not None
+
+    @pytest.mark.django_db
+    def test_wrong_password_sends_user_login_failed(self):
+        user = UserFactory()
+        serializer = CustomTokenObtainPairSerializer(context={'request': None})
+        received = []
+
+        def receiver(sender, credentials, **kwargs):
+            received.append(credentials)
+
+        user_login_failed.connect(receiver)
+        try:
+            with pytest.raises(serializers.ValidationError, match="Invalid credentials"):
+                serializer.validate({'username': user.username, 'password': 'wrong-password'})
+        finally:
+            user_login_failed.disconnect(receiver)
+
+        assert received == [{'username': user.username, 'password': '********************'}]
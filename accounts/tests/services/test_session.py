@@ -12,7 +12,14 @@ from rest_framework_simplejwt.token_blacklist.models import (
 )
 from rest_framework_simplejwt.tokens import RefreshToken
 
-from accounts.services.session import detect_refresh_reuse, revoke_all_sessions
+from accounts.services.session import (
+    BLACKLISTED_JTI_KEY,
+    detect_refresh_reuse,
+    is_expired_jwt,
+    is_jti_blacklisted,
+    looks_like_jwt,
+    revoke_all_sessions,
+)
 from accounts.tests.factories._user import UserFactory
 
 
@@ -24,6 +31,42 @@ def _clear_cache():
     cache.clear()
 
 
+class TestLooksLikeJwt:
+    @pytest.mark.django_db
+    def test_accepts_a_real_refresh_token(self, user):
+        assert looks_like_jwt(str(RefreshToken.for_user(user))) is True
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            None,
+            "",
+            "not-a-token",
+            "two.segments",
+            "four.dot.separated.segments",
+            "empty..segment",
+            "non.ascii.tökén",
+            "a." + "b" * 5000 + ".c",
+        ],
+    )
+    def test_rejects_structurally_impossible_values(self, raw):
+        assert looks_like_jwt(raw) is False
+
+
+@pytest.mark.django_db
+class TestIsExpiredJwt:
+    def test_live_token_is_not_expired(self, user):
+        assert is_expired_jwt(str(RefreshToken.for_user(user))) is False
+
+    def test_past_exp_is_expired(self, user):
+        token = RefreshToken.for_user(user)
+        token.set_exp(lifetime=-timedelta(seconds=1))
+        assert is_expired_jwt(str(token)) is True
+
+    def test_unreadable_payload_is_not_reported_expired(self):
+        assert is_expired_jwt("not.a.jwt") is False
+
+
 @pytest.mark.django_db
 class TestRevokeAllSessions:
     def test_blacklists_every_outstanding_token_and_returns_the_count(self):
@@ -69,6 +112,46 @@ class TestRevokeAllSessions:
 
         assert second_count == 0
 
+    def test_blacklists_in_one_select_and_one_insert(self, django_assert_num_queries):
+        user = UserFactory()
+        already_revoked = RefreshToken.for_user(user)
+        RefreshToken.for_user(user)
+        RefreshToken.for_user(user)
+        BlacklistedToken.objects.create(
+            token=OutstandingToken.objects.get(jti=already_revoked["jti"])
+        )
+
+        with django_assert_num_queries(2):
+            count = revoke_all_sessions(user.id, event="account_deletion")
+
+        assert count == 2
+        assert BlacklistedToken.objects.filter(token__user_id=user.id).count() == 3
+
+    def test_mirrors_revoked_jtis_into_the_cache(self):
+        user = UserFactory()
+        refresh = RefreshToken.for_user(user)
+
+        revoke_all_sessions(user.id, event="logout_all")
+
+        assert cache.get(BLACKLISTED_JTI_KEY.format(jti=refresh["jti"])) == 1
+
+
+@pytest.mark.django_db
+class TestIsJtiBlacklisted:
+    def test_unknown_jti_is_not_blacklisted(self):
+        assert is_jti_blacklisted("no-such-jti") is False
+
+    def test_db_hit_backfills_the_cache(self, django_assert_num_queries):
+        user = UserFactory()
+        refresh = RefreshToken.for_user(user)
+        outstanding = OutstandingToken.objects.get(jti=refresh["jti"])
+        BlacklistedToken.objects.create(token=outstanding)
+
+        with django_assert_num_queries(1):
+            assert is_jti_blacklisted(refresh["jti"]) is True
+        with django_assert_num_queries(0):
+            assert is_jti_blacklisted(refresh["jti"]) is True
+
 
 @pytest.mark.django_db
 class TestDetectRefreshReuse:
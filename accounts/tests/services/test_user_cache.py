@@ -0,0 +1,94 @@
+"""
+Tests for accounts/services/user_cache.py — authenticated-user cache.
+Path: accounts/tests/services/test_user_cache.py
+"""
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.services.user_cache import ACTIVATED_CACHE_KEY, AUTH_USER_KEY, get_cached_user
+from accounts.tests.factories._user import UserFactory
+
+
+@pytest.mark.django_db
+class TestGetCachedUser:
+    def test_second_lookup_skips_the_db(self, user, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            assert get_cached_user(user.pk) == user
+        with django_assert_num_queries(0):
+            assert get_cached_user(user.pk) == user
+
+    def test_missing_user_is_not_cached(self):
+        assert get_cached_user(999999) is None
+        assert cache.get(AUTH_USER_KEY.format(user_id=999999)) is None
+
+    def test_save_invalidates_entry(self, user):
+        get_cached_user(user.pk)
+        user.is_verified = not user.is_verified
+        user.save(update_fields=["is_verified"])
+
+        assert cache.get(AUTH_USER_KEY.format(user_id=user.pk)) is None
+        assert get_cached_user(user.pk).is_verified == user.is_verified
+
+    def test_save_drops_activation_marker(self, user):
+        key = ACTIVATED_CACHE_KEY.format(user_id=user.pk)
+        cache.set(key, 1)
+        user.is_active = False
+        user.save(update_fields=["is_active"])
+
+        assert cache.get(key) is None
+
+    def test_delete_invalidates_entry(self):
+        user = UserFactory()
+        user_id = user.pk
+        get_cached_user(user_id)
+        user.delete()
+
+        assert get_cached_user(user_id) is None
+
+    def test_password_hash_is_not_cached(self, user, django_assert_num_queries):
+        user.set_password("testpass123")
+        user.save(update_fields=["password"])
+        get_cached_user(user.pk)
+
+        assert "password" not in cache.get(AUTH_USER_KEY.format(user_id=user.pk))
+        cached = get_cached_user(user.pk)
+        with django_assert_num_queries(1):
+            assert cached.check_password("testpass123")
+
+    def test_lookup_uses_configured_user_id_field(self, user, monkeypatch):
+        monkeypatch.setattr(api_settings, "USER_ID_FIELD", "username")
+
+        assert get_cached_user(user.username) == user
+        user.save(update_fields=["is_verified"])
+        assert cache.get(AUTH_USER_KEY.format(user_id=user.username)) is None
+
+    def test_commit_clears_entry_recached_inside_the_transaction(
+        self, user, django_capture_on_commit_callbacks
+    ):
+        key = AUTH_USER_KEY.format(user_id=user.pk)
+        with django_capture_on_commit_callbacks(execute=True):
+            user.is_active = False
+            user.save(update_fields=["is_active"])
+            # A concurrent request re-caches the pre-commit row.
+            cache.set(key, {"id": user.pk, "is_active": True})
+
+        assert cache.get(key) is None
+
+
+@pytest.mark.django_db
+class TestAuthenticationUsesUserCache:
+    def test_deactivated_user_is_rejected_despite_cache(self, user):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+        url = reverse("user-me")
+        assert client.get(url).status_code == status.HTTP_200_OK
+
+        user.is_active = False
+        user.save(update_fields=["is_active"])
+
+        assert client.get(url).status_code == status.HTTP_401_UNAUTHORIZED
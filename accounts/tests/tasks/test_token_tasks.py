@@ -1,5 +1,5 @@
 """
-Tests for accounts.tasks.token_tasks.flush_expired_jwt_tokens.
+Tests for accounts.tasks.token_tasks (flush_expired_jwt_tokens, blacklist_refresh_token).
 Path: accounts/tests/tasks/test_token_tasks.py
 """
 
@@ -11,9 +11,15 @@ from rest_framework_simplejwt.token_blacklist.models import (
     BlacklistedToken,
     OutstandingToken,
 )
+from rest_framework_simplejwt.tokens import RefreshToken
 
-from accounts.tasks import example_cleanup_task, flush_expired_jwt_tokens
+from accounts.tasks import (
+    blacklist_refresh_token,
+    example_cleanup_task,
+    flush_expired_jwt_tokens,
+)
 from accounts.tests.factories import UserFactory
+from accounts.tokens import KidRefreshToken
 
 
 @pytest.mark.django_db
@@ -89,3 +95,43 @@ def test_accounts_tasks_package_reexports_both_tasks():
     # the expected registered Celery task names.
     assert example_cleanup_task.name == "accounts.tasks.example_cleanup_task"
     assert flush_expired_jwt_tokens.name == "accounts.tasks.flush_expired_jwt_tokens"
+
+
+@pytest.mark.django_db
+def test_blacklist_refresh_token_blacklists_valid_token():
+    refresh = RefreshToken.for_user(UserFactory())
+
+    assert blacklist_refresh_token(str(refresh)) is True
+    assert BlacklistedToken.objects.filter(token__jti=refresh["jti"]).exists()
+
+
+@pytest.mark.django_db
+def test_blacklist_refresh_token_is_noop_for_already_blacklisted_token():
+    refresh = RefreshToken.for_user(UserFactory())
+    refresh.blacklist()
+
+    assert blacklist_refresh_token(str(refresh)) is False
+    assert BlacklistedToken.objects.filter(token__jti=refresh["jti"]).count() == 1
+
+
+@pytest.mark.django_db
+def test_blacklist_refresh_token_writes_row_for_cache_marked_token():
+    """Logout marks the jti in the cache before queueing; the row must still land."""
+    refresh = KidRefreshToken.for_user(UserFactory())
+    refresh.mark_blacklisted()
+
+    assert blacklist_refresh_token(str(refresh)) is True
+    assert BlacklistedToken.objects.filter(token__jti=refresh["jti"]).exists()
+
+
+@pytest.mark.django_db
+def test_blacklist_refresh_token_skips_expired_token():
+    refresh = RefreshToken.for_user(UserFactory())
+    refresh.set_exp(lifetime=-timedelta(seconds=1))
+
+    assert blacklist_refresh_token(str(refresh)) is False
+    assert not BlacklistedToken.objects.exists()
+
+
+def test_blacklist_refresh_token_has_expected_task_name():
+    assert blacklist_refresh_token.name == "accounts.tasks.blacklist_refresh_token"
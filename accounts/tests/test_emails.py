@@ -46,6 +46,27 @@ class TestCustomActivationEmail:
         assert context_data['site_name'] == 'Your App Name'
         assert context_data['support_email'] == 'support@yourapp.com'
     
+    @pytest.mark.django_db
+    def test_activation_email_url_reuses_uid_and_token(self):
+        """Test that the activation token is generated once and reused in the URL."""
+        from unittest.mock import patch
+
+        user = UserFactory()
+        email = CustomActivationEmail()
+        email.context = {'user': user}
+
+        with patch(
+            'accounts.emails.default_token_generator.make_token',
+            return_value='tok-123',
+        ) as mock_make_token:
+            context_data = email.get_context_data()
+
+        mock_make_token.assert_called_once_with(user)
+        assert context_data['token'] == 'tok-123'
+        assert context_data['url'] == (
+            f"/api/v1/auth/users/activation/{context_data['uid']}/tok-123/"
+        )
+    
     @pytest.mark.django_db
     def test_activation_email_context_no_user(self):
         """Test that activation email handles missing user gracefully."""
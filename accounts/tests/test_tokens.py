@@ -6,9 +6,15 @@ Path: accounts/tests/test_tokens.py
 import jwt as pyjwt
 import pytest
 from django.conf import settings
+from django.core.cache import cache
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from accounts.services.session import BLACKLISTED_JTI_KEY
 
 from accounts.tests.factories._user import UserFactory
-from accounts.tokens import KidAccessToken, KidRefreshToken
+from accounts.tokens import KidAccessToken, KidRefreshToken, _prepared_signing_key
+from config.jwt_keys import generate_rsa_private_key, private_key_to_pem, public_key_to_pem
 
 
 @pytest.mark.django_db
@@ -54,6 +60,34 @@ class TestKidRefreshToken:
         assert header["kid"] == settings.SIMPLE_JWT["KID"]
 
 
+class TestPreparedSigningKey:
+    def test_signing_key_is_parsed_once(self):
+        key = settings.SIMPLE_JWT["SIGNING_KEY"]
+
+        first = _prepared_signing_key("RS256", key)
+
+        assert not isinstance(first, str)
+        assert _prepared_signing_key("RS256", key) is first
+
+    def test_rotated_signing_key_signs_new_tokens(self, monkeypatch):
+        user = UserFactory.build(pk=1)
+        str(KidAccessToken.for_user(user))  # prime the cache with the current key
+        new_key = generate_rsa_private_key()
+        token = KidAccessToken.for_user(user)
+        monkeypatch.setattr(token.token_backend, "signing_key", private_key_to_pem(new_key))
+
+        encoded = str(token)
+
+        decode_kwargs = {
+            "algorithms": ["RS256"],
+            "audience": settings.SIMPLE_JWT["AUDIENCE"],
+            "issuer": settings.SIMPLE_JWT["ISSUER"],
+        }
+        pyjwt.decode(encoded, key=public_key_to_pem(new_key), **decode_kwargs)
+        with pytest.raises(pyjwt.InvalidSignatureError):
+            pyjwt.decode(encoded, key=settings.SIMPLE_JWT["VERIFYING_KEY"], **decode_kwargs)
+
+
 @pytest.mark.django_db
 class TestKidMixinParityWithTokenBackendEncode:
     """
@@ -85,3 +119,25 @@ class TestKidMixinParityWithTokenBackendEncode:
         )
 
         assert ours == upstream
+
+
+@pytest.mark.django_db
+class TestKidRefreshTokenBlacklist:
+    def test_blacklist_writes_the_db_row_and_the_cache_entry(self):
+        refresh = KidRefreshToken.for_user(UserFactory())
+
+        refresh.blacklist()
+
+        assert BlacklistedToken.objects.filter(token__jti=refresh["jti"]).exists()
+        assert cache.get(BLACKLISTED_JTI_KEY.format(jti=refresh["jti"])) == 1
+
+    def test_cached_blacklist_entry_rejects_the_token_without_a_query(
+        self, django_assert_num_queries
+    ):
+        refresh = KidRefreshToken.for_user(UserFactory())
+        raw = str(refresh)
+        refresh.blacklist()
+
+        with django_assert_num_queries(0):
+            with pytest.raises(TokenError):
+                KidRefreshToken(raw)
@@ -3,6 +3,8 @@ Tests for accounts utils module.
 Path: accounts/tests/test_utils.py
 """
 
+from types import SimpleNamespace
+
 import pytest
 from django.test import RequestFactory
 from accounts.utils import jwt_only_logout_user
@@ -28,8 +30,8 @@ class TestUtils:
         request = factory.post('/')
         
         # Mock an authenticated request
-        request.user = type('User', (), {'id': 1, 'username': 'testuser'})()
-        request.auth = type('Token', (), {'token': 'test-token'})()
+        request.user = SimpleNamespace(id=1, username='testuser')
+        request.auth = SimpleNamespace(token='test-token')
         
         # Should still do nothing
         result = jwt_only_logout_user(request)
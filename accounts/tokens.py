@@ -12,9 +12,30 @@ copy silently drifts. Decode/verification is untouched (SimpleJWT ignores
 the kid header); the kid only serves external JWKS consumers.
 """
 
+from functools import lru_cache
+
 import jwt as pyjwt
+from jwt.algorithms import get_default_algorithms
 from django.conf import settings as django_settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings as simplejwt_settings
 from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from accounts.services.session import is_jti_blacklisted, mark_jtis_blacklisted
+
+
+@lru_cache(maxsize=8)
+def _prepared_signing_key(algorithm: str, key):
+    """
+    Return ``key`` parsed into the object PyJWT signs with.
+
+    Given a PEM string, ``pyjwt.encode`` re-parses (and, for RSA, re-validates)
+    the private key on every call, which dwarfs the signature itself. Keyed
+    on the key material, so a rotated SIGNING_KEY is picked up as a new entry.
+    """
+    return get_default_algorithms()[algorithm].prepare_key(key)
 
 
 class _KidMixin:
@@ -37,7 +58,7 @@ class _KidMixin:
 
         token = pyjwt.encode(
             payload,
-            backend.signing_key,
+            _prepared_signing_key(backend.algorithm, backend.signing_key),
             algorithm=backend.algorithm,
             headers=headers,
         )
@@ -48,7 +69,36 @@ class KidAccessToken(_KidMixin, AccessToken):
     pass
 
 
-class KidRefreshToken(_KidMixin, RefreshToken):
+class _CachedBlacklistMixin:
+    """
+    Answers blacklist checks from the cache before querying
+    BlacklistedToken, and mirrors new blacklist entries into it.
+    See ``accounts.services.session.BLACKLISTED_JTI_KEY``.
+    """
+
+    def check_blacklist(self) -> None:
+        if is_jti_blacklisted(self.payload[simplejwt_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self):
+        result = super().blacklist()
+        self.mark_blacklisted()
+        return result
+
+    def mark_blacklisted(self) -> None:
+        """
+        Record this token as blacklisted in the cache only.
+
+        Lets callers that defer the BlacklistedToken write to a worker make
+        the revocation visible immediately; the DB row still follows.
+        """
+        mark_jtis_blacklisted([(
+            self.payload[simplejwt_settings.JTI_CLAIM],
+            datetime_from_epoch(self.payload["exp"]),
+        )])
+
+
+class KidRefreshToken(_KidMixin, _CachedBlacklistMixin, RefreshToken):
     # RefreshToken.access_token is a property that instantiates
     # `self.access_token_class()` — overriding the class attribute is
     # sufficient in this simplejwt version to make rotated access tokens
@@ -32,6 +32,13 @@ LOGGING = {
     },
 }
 
+# LOGGING above only covers stdlib loggers. Loguru (config.logger) keeps its
+# console and per-level file sinks regardless, so drop them: every log call
+# becomes a no-op. Tests that assert on log output add their own sink.
+from config.logger import logger as _loguru_logger
+
+_loguru_logger.remove()
+
 # Use faster password hasher for tests
 PASSWORD_HASHERS = [
     'django.contrib.auth.hashers.MD5PasswordHasher',
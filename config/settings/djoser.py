@@ -56,19 +56,6 @@ DJOSER = {
         'user_delete': 'accounts.serializers.auth.UserDeleteSerializer',
     },
     # ──────────────────────────────────────────────
-    # VIEWS (Custom views to handle JWT properly)
-    # ──────────────────────────────────────────────
-    'VIEWS': {
-        'user': 'accounts.controllers.CustomUserViewSet',
-        'token_create': 'accounts.controllers.CustomTokenCreateView',
-        'token_destroy': 'accounts.controllers.CustomTokenDestroyView',
-        # Completely override activation views to avoid conflicts
-        'activation': 'accounts.controllers.CustomActivationView',
-        'activation_confirm': 'accounts.controllers.CustomActivationView',
-        'activation_activate': 'accounts.controllers.CustomActivationView',
-        'activation_resend': 'accounts.controllers.CustomActivationView',
-    },
-    # ──────────────────────────────────────────────
     # PERMISSIONS (granular per endpoint)
     # ──────────────────────────────────────────────
     'PERMISSIONS': {
@@ -83,7 +83,7 @@ async def _safe_cache_get(key):
     try:
         return await sync_to_async(cache.get)(key)
     except Exception as e:
-        logger.warning("Cache get failed (Redis down?): %s", e)
+        logger.bind(error=type(e).__name__).warning("ws.auth.cache_get_failed")
         return None
 
 
@@ -92,7 +92,7 @@ async def _safe_cache_set(key, value, ttl):
     try:
         await sync_to_async(cache.set)(key, value, ttl)
     except Exception as e:
-        logger.warning("Cache set failed (Redis down?): %s", e)
+        logger.bind(error=type(e).__name__).warning("ws.auth.cache_set_failed")
 
 
 async def _safe_cache_delete(key):
@@ -100,7 +100,7 @@ async def _safe_cache_delete(key):
     try:
         await sync_to_async(cache.delete)(key)
     except Exception as e:
-        logger.warning("Cache delete failed (Redis down?): %s", e)
+        logger.bind(error=type(e).__name__).warning("ws.auth.cache_delete_failed")
 
 
 async def _is_token_revoked(access_token, user_id):
@@ -169,13 +169,13 @@ async def get_user_from_token(token_string):
     try:
         access_token = await sync_to_async(_validate_token_sync)(token_string)
     except (TokenError, InvalidToken) as e:
-        logger.warning("JWT token validation failed: %s", type(e).__name__)
+        logger.bind(error=type(e).__name__).warning("ws.auth.token_invalid")
         token_hash = hashlib.sha256(token_string.encode()).hexdigest()
         cache_key = f"ws_jwt_user:{token_hash}"
         await _safe_cache_delete(cache_key)
         return None
     except Exception as e:
-        logger.error("Unexpected error validating JWT token: %s", type(e).__name__)
+        logger.bind(error=type(e).__name__).error("ws.auth.token_validation_error")
         return None
 
     user_id = access_token.get("user_id")
@@ -197,7 +197,7 @@ async def get_user_from_token(token_string):
     if cached_user_id:
         user = await get_user_by_id(cached_user_id)
         if user and user.is_active:
-            logger.debug(f"Retrieved cached user {cached_user_id}")
+            logger.bind(user_id=cached_user_id).debug("ws.auth.user_cache_hit")
             return user
         await _safe_cache_delete(cache_key)
 
@@ -206,13 +206,13 @@ async def get_user_from_token(token_string):
 
     if user:
         if not user.is_active:
-            logger.warning(f"User {user_id} is inactive, denying WebSocket auth")
+            logger.bind(user_id=user_id).warning("ws.auth.user_inactive")
             return None
         await _safe_cache_set(cache_key, user_id, USER_CACHE_TTL)
-        logger.debug(f"Successfully authenticated user {user_id} via JWT token")
+        logger.bind(user_id=user_id).debug("ws.auth.user_authenticated")
         return user
     else:
-        logger.warning(f"User {user_id} not found for valid token")
+        logger.bind(user_id=user_id).warning("ws.auth.user_not_found")
 
     return None
 
@@ -327,7 +327,7 @@ class JWTAuthMiddleware(BaseMiddleware):
             if user:
                 scope["user"] = user
                 scope["jwt_auth_failed"] = False
-                logger.debug(f"WebSocket authenticated: user_id={user.id}")
+                logger.bind(user_id=user.id).debug("ws.auth.scope_authenticated")
             else:
                 # A token WAS presented but failed validation — flag it so
                 # consumers can distinguish "auth failed" (close 4401) from
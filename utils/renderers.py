@@ -0,0 +1,45 @@
+"""
+JSON renderer backed by orjson.
+
+Path: utils/renderers.py
+
+`orjson` is a declared runtime dependency (pinned in uv.lock). When the
+client asks for indented output, `ORJSONRenderer` is exactly DRF's
+`JSONRenderer`. Otherwise response bodies are dumped by orjson, with any type orjson does not handle natively (Decimal,
+lazy translation strings, datetimes, ...) delegated to DRF's own
+`JSONEncoder` so the wire format stays the same. Payloads orjson refuses
+(integers outside the 64-bit range) are rendered by `JSONRenderer` instead.
+
+One known difference: orjson writes NaN and +/-Infinity as ``null``, where
+DRF's strict `JSONRenderer` raises ``ValueError``.
+"""
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+import orjson
+_drf_encoder = JSONEncoder()
+
+# Datetimes are passed through to DRF's encoder so they keep its exact
+# formatting (``Z`` suffix for UTC); non-str dict keys are stringified as
+# json.dumps would.
+_ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+class ORJSONRenderer(JSONRenderer):
+    """`JSONRenderer` that serializes with orjson."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if data is None:
+            return b""
+
+        try:
+            ret = orjson.dumps(data, default=_drf_encoder.default, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Match JSONRenderer: escape U+2028/U+2029, which are valid JSON but
+        # not valid inside JavaScript string literals.
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
@@ -0,0 +1,51 @@
+"""
+Tests for the orjson-backed JSON renderer.
+Path: utils/tests/test_renderers.py
+"""
+
+import datetime
+from decimal import Decimal
+import pytest
+from django.utils.translation import gettext_lazy as _
+from rest_framework.renderers import JSONRenderer
+
+from utils.renderers import ORJSONRenderer
+
+PAYLOAD = {
+    "success": True,
+    "data": {
+        "id": 1,
+        "amount": Decimal("1.50"),
+        "label": _("Users"),
+        "joined": datetime.datetime(2026, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+        "note": "line\u2028break",
+        7: "int key",
+    },
+    "meta": None,
+}
+
+
+def test_indented_output_uses_json_renderer():
+    media_type = "application/json; indent=4"
+    assert ORJSONRenderer().render(PAYLOAD, media_type) == JSONRenderer().render(PAYLOAD, media_type)
+
+
+def test_none_renders_empty_body():
+    assert ORJSONRenderer().render(None) == b""
+
+
+def test_orjson_output_matches_json_renderer():
+    assert ORJSONRenderer().render(PAYLOAD) == JSONRenderer().render(PAYLOAD)
+
+
+def test_out_of_range_int_falls_back_to_json_renderer():
+    data = {"n": 2**70}
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data) == b'{"n":1180591620717411303424}'
+
+
+def test_non_finite_float_renders_null_under_orjson():
+    # Documented difference: JSONRenderer is strict about NaN/Infinity.
+    data = {"x": float("nan"), "y": float("inf")}
+    assert ORJSONRenderer().render(data) == b'{"x":null,"y":null}'
+    with pytest.raises(ValueError):
+        JSONRenderer().render(data)